@@ -27,8 +27,11 @@ from submanager.types import (
 
 # ---- Constants and enums ----
 
-TESTABLE_SCOPES: Final[frozenset[str]] = frozenset(
-    ("*", "identity", "read", "wikiread"),
+SCOPES_IDENTITY: Final[frozenset[str]] = frozenset(("*", "identity"))
+SCOPES_READ_POST: Final[frozenset[str]] = frozenset(("read",))
+SCOPES_READ_WIKI: Final[frozenset[str]] = frozenset(("wikiread",))
+TESTABLE_SCOPES: Final[frozenset[str]] = (
+    SCOPES_IDENTITY | SCOPES_READ_POST | SCOPES_READ_WIKI
 )
 TEST_PAGE_WIKI: Final[str] = "index"
 TEST_SUB_POST: Final[str] = "all"
@@ -55,12 +58,6 @@ def try_perform_test_request(
     scope_check: ScopeCheck,
 ) -> None:
     """Attempt to perform a test Reddit request against a valid scope."""
-    warning_message = (
-        # static analysis: ignore[missing_f]
-        f"Error finding {{test_item}} testing scope {scope_check.value!r} "
-        f"with account {account_key!r} ({{error}})"
-    )
-
     # Ideally, simply check the account's identity
     if scope_check is ScopeCheck.IDENTITY:
         reddit.user.me()
@@ -68,17 +65,28 @@ def try_perform_test_request(
     # Read an arbitrary thread
     elif scope_check is ScopeCheck.READ_POST:
         try:
-            list(reddit.subreddit(TEST_SUB_POST).hot(limit=1))[0].id
-        except submanager.exceptions.PRAW_NOTFOUND_ERRORS as error:
-            warning_message = warning_message.format(
-                test_item=f"sub 'r/{TEST_SUB_POST}'",
-                error=submanager.utils.output.format_error(error),
+            test_post = next(
+                iter(reddit.subreddit(TEST_SUB_POST).hot(limit=1)),
+                None,
             )
+        except submanager.exceptions.PRAW_NOTFOUND_ERRORS as error:
             warnings.warn(
-                warning_message,
+                f"Error finding sub 'r/{TEST_SUB_POST}' "
+                f"testing scope {scope_check.value!r} "
+                f"with account {account_key!r} "
+                f"({submanager.utils.output.format_error(error)})",
                 submanager.exceptions.TestPageNotFoundWarning,
                 stacklevel=2,
             )
+        else:
+            if test_post is None:
+                warnings.warn(
+                    f"No posts found in sub 'r/{TEST_SUB_POST}' "
+                    f"testing scope {scope_check.value!r} "
+                    f"with account {account_key!r}",
+                    submanager.exceptions.TestPageNotFoundWarning,
+                    stacklevel=2,
+                )
 
     # Read an arbitrary wiki page
     elif scope_check is ScopeCheck.READ_WIKI:
@@ -87,14 +95,12 @@ def try_perform_test_request(
         except (  # noqa: WPS440
             submanager.exceptions.PRAW_NOTFOUND_ERRORS
         ) as error:
-            warning_message = warning_message.format(
-                test_item=(
-                    f"sub 'r/{TEST_SUB_WIKI}', wiki page {TEST_PAGE_WIKI!r}"
-                ),
-                error=submanager.utils.output.format_error(error),
-            )
             warnings.warn(
-                warning_message,
+                f"Error finding sub 'r/{TEST_SUB_WIKI}', "
+                f"wiki page {TEST_PAGE_WIKI!r} "
+                f"testing scope {scope_check.value!r} "
+                f"with account {account_key!r} "
+                f"({submanager.utils.output.format_error(error)})",
                 submanager.exceptions.TestPageNotFoundWarning,
                 stacklevel=2,
             )
@@ -114,13 +120,13 @@ def perform_test_request(
 ) -> bool:
     """Perform a test Reddit request based on the scope to confirm access."""
     # Ideally, simply check the account's identity
-    if "*" in scopes or "identity" in scopes:
+    if not SCOPES_IDENTITY.isdisjoint(scopes):
         scope_check = ScopeCheck.IDENTITY
     # Read an arbitrary thread
-    elif "read" in scopes:
+    elif not SCOPES_READ_POST.isdisjoint(scopes):
         scope_check = ScopeCheck.READ_POST
     # Read an arbitrary wiki page
-    elif "wikiread" in scopes:
+    elif not SCOPES_READ_WIKI.isdisjoint(scopes):
         scope_check = ScopeCheck.READ_WIKI
     # Otherwise, if no common scopes are authorized, check the username
     else:
@@ -195,28 +201,14 @@ def validate_account_offline(
     return True
 
 
-def validate_account(
+def validate_account_online(
     reddit: praw.reddit.Reddit,
     account_key: str,
     *,
-    offline_only: bool = False,
-    check_readonly: bool = True,
     raise_error: bool = True,
 ) -> bool:
-    """Check if the Reddit account associated with the object is authorized."""
-    # First, do offline validation
-    account_valid = validate_account_offline(
-        reddit=reddit,
-        account_key=account_key,
-        check_readonly=check_readonly,
-        raise_error=raise_error,
-    )
-    if not account_valid:
-        return False
-    if offline_only:
-        return True
-
-    # Then, perform a request to get the authorized scopes
+    """Validate the passed account by making requests to Reddit."""
+    # First, perform a request to get the authorized scopes
     try:
         scopes: set[str] = reddit.auth.scopes()
     except submanager.exceptions.PRAW_REDDIT_ERRORS as error:
@@ -249,6 +241,35 @@ def validate_account(
     return account_valid
 
 
+def validate_account(
+    reddit: praw.reddit.Reddit,
+    account_key: str,
+    *,
+    offline_only: bool = False,
+    check_readonly: bool = True,
+    raise_error: bool = True,
+) -> bool:
+    """Check if the Reddit account associated with the object is authorized."""
+    # First, do offline validation
+    account_valid = validate_account_offline(
+        reddit=reddit,
+        account_key=account_key,
+        check_readonly=check_readonly,
+        raise_error=raise_error,
+    )
+    if not account_valid:
+        return False
+    if offline_only:
+        return True
+
+    # Then, validate against Reddit itself
+    return validate_account_online(
+        reddit=reddit,
+        account_key=account_key,
+        raise_error=raise_error,
+    )
+
+
 # ---- Top level account validation ----
 
 
@@ -274,8 +295,8 @@ def validate_accounts(
             raise_error=raise_error,
         )
         if account_valid and not offline_only:
-            account_valid = validate_account(
-                reddit,
+            account_valid = validate_account_online(
+                reddit=reddit,
                 account_key=account_key,
                 raise_error=raise_error,
             )
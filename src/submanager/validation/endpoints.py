@@ -7,6 +7,7 @@ from __future__ import (
 
 # Standard library imports
 from typing import (
+    Tuple,
     Union,
 )
 
@@ -15,6 +16,7 @@ import prawcore.exceptions
 
 # Local imports
 import submanager.endpoint.creation
+import submanager.enums
 import submanager.exceptions
 import submanager.models.config
 import submanager.utils.output
@@ -26,6 +28,38 @@ ManagerWithEndpoints = Union[
     submanager.models.config.SyncManagerConfig,
     submanager.models.config.ThreadManagerConfig,
 ]
+EndpointValidationKey = Tuple[
+    str,
+    str,
+    submanager.enums.EndpointType,
+    str,
+    bool,
+]
+
+
+def get_check_editable(
+    config: submanager.models.config.EndpointTypeConfig,
+    check_editable: bool | None = None,
+) -> bool:
+    """Get whether to check the endpoint is editable; by default, targets."""
+    if check_editable is None:
+        return "target" in config.uid
+    return check_editable
+
+
+def get_endpoint_validation_key(
+    config: submanager.models.config.EndpointTypeConfig,
+    *,
+    check_editable: bool | None = None,
+) -> EndpointValidationKey:
+    """Get the settings that determine the result of validating an endpoint."""
+    return (
+        config.context.account,
+        config.context.subreddit,
+        config.endpoint_type,
+        config.endpoint_name,
+        get_check_editable(config, check_editable=check_editable),
+    )
 
 
 def validate_endpoint(
@@ -36,8 +70,7 @@ def validate_endpoint(
     raise_error: bool = True,
 ) -> bool:
     """Validate that the sync endpoint points to a valid Reddit object."""
-    if check_editable is None:
-        check_editable = "target" in config.uid
+    check_editable = get_check_editable(config, check_editable=check_editable)
     reddit = accounts[config.context.account]
 
     details_urls = [
@@ -93,13 +126,17 @@ def _get_manager_endpoints(
     if not (include_disabled or manager_config.enabled):
         return endpoints
     for config_item in manager_config.items.values():
-        if include_disabled or config_item.enabled:
-            endpoints.append(config_item.source)
-            if isinstance(
-                config_item,
-                submanager.models.config.SyncItemConfig,
-            ):
-                endpoints += list(config_item.targets.values())
+        if not (include_disabled or config_item.enabled):
+            continue
+        item_endpoints = [config_item.source]
+        if isinstance(config_item, submanager.models.config.SyncItemConfig):
+            item_endpoints += config_item.targets.values()
+        # Prune the endpoints to just enabled unless told otherwise
+        endpoints += [
+            endpoint
+            for endpoint in item_endpoints
+            if include_disabled or endpoint.enabled
+        ]
     return endpoints
 
 
@@ -122,11 +159,6 @@ def get_all_endpoints(
         include_disabled=include_disabled,
     )
 
-    # Pune the endpoints to just enabled unless told otherwise
-    if not include_disabled:
-        all_endpoints = [
-            endpoint for endpoint in all_endpoints if endpoint.enabled
-        ]
     return all_endpoints
 
 
@@ -146,15 +178,22 @@ def validate_endpoints(
         include_disabled=include_disabled,
     )
 
-    # Check if each endpoint is valid
+    # Check if each endpoint is valid, only once per distinct Reddit object
     endpoints_valid = {}
+    objects_valid: dict[EndpointValidationKey, bool] = {}
     for endpoint in all_endpoints:
-        vprint(f"Validating endpoint {endpoint.uid!r}")
-        endpoint_valid = validate_endpoint(
-            config=endpoint,
-            accounts=accounts,
-            raise_error=raise_error,
-        )
+        object_key = get_endpoint_validation_key(endpoint)
+        endpoint_valid = objects_valid.get(object_key)
+        if endpoint_valid is not None:
+            vprint(f"Validating endpoint {endpoint.uid!r} (cached)")
+        else:
+            vprint(f"Validating endpoint {endpoint.uid!r}")
+            endpoint_valid = validate_endpoint(
+                config=endpoint,
+                accounts=accounts,
+                raise_error=raise_error,
+            )
+            objects_valid[object_key] = endpoint_valid
         endpoints_valid[endpoint.uid] = endpoint_valid
 
     return endpoints_valid
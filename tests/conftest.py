@@ -6,12 +6,14 @@ from __future__ import (
 )
 
 # Standard library imports
-import configparser
+import enum
 import os
+import re
 from pathlib import (
     Path,
 )
 from typing import (
+    Callable,
     Collection,
     Mapping,
 )
@@ -34,8 +36,15 @@ from typing_extensions import (
 PACKAGE_NAME: Final[str] = "submanager"
 
 LINE_LENGTH: Final[int] = 70
+WARNING_HIGHLIGHT: Final[str] = "*" * (LINE_LENGTH // 2)
+WARNING_DIVIDER: Final[str] = (
+    f"{WARNING_HIGHLIGHT} WARNING {WARNING_HIGHLIGHT}"
+)
 
 RUN_ONLINE_OPTION: Final[str] = "--run-online"
+RUN_SLOW_OPTION: Final[str] = "--run-slow"
+
+XDIST_WORKER_ATTR: Final[str] = "workerinput"
 
 PRAW_INI_FILENAME: Final[str] = "praw.ini"
 PRAW_INI_PATH_LOCAL: Final[Path] = Path() / PRAW_INI_FILENAME
@@ -48,13 +57,26 @@ PRAW_ENV_VARS_PASSWORD: Final[set[str]] = {"praw_username", "praw_password"}
 PRAW_ENV_VARS_ALL: Final[set[str]] = (
     PRAW_ENV_VARS_REQUIRED | PRAW_ENV_VARS_REFRESH | PRAW_ENV_VARS_PASSWORD
 )
+PRAW_INI_SECTION_PATTERN: Final[re.Pattern[str]] = re.compile(
+    r"^\s*\[([^\]]+)\]",
+    flags=re.MULTILINE,
+)
 TEST_SITE_NAME: Final[str] = "submanager_testbot"
 
+SCALAR_ID_TYPES: Final[tuple[type, ...]] = (int, float, complex, bool)
+
 DUMMY_ACCOUNT_CONFIG: Final[dict[str, str]] = {
     "client_id": "abcdefgABCDEFG",
     "client_secret": "abcdefghijklmnopqrstuvwxyzABCD",
     "refresh_token": "123456789100-abcdefghijklmnopqrstuvwxyzABCD",
 }
+DUMMY_PRAW_INI_TEXT: Final[str] = "".join(
+    [
+        f"[{TEST_SITE_NAME}]\n",
+        *[f"{key} = {value}\n" for key, value in DUMMY_ACCOUNT_CONFIG.items()],
+        "\n",
+    ],
+)
 
 
 # ---- Helpers ----
@@ -62,21 +84,30 @@ DUMMY_ACCOUNT_CONFIG: Final[dict[str, str]] = {
 
 def _get_praw_ini_has_site_name(site_name: str) -> bool | None:
     """Determine whether the default praw.ini file contains the site."""
-    praw_config = configparser.ConfigParser()
     user_config_path = platformdirs.user_config_path(roaming=True)
     praw_ini_path = user_config_path / PRAW_INI_FILENAME
-    if not praw_ini_path.exists():
-        return None
     try:
-        praw_config.read(praw_ini_path)
-    except configparser.Error:
+        praw_ini_text = praw_ini_path.read_text(encoding="utf-8")
+    except (OSError, UnicodeError):
         return None
-    return praw_config.has_section(site_name)
+    return any(
+        section_match.group(1).strip() == site_name
+        for section_match in PRAW_INI_SECTION_PATTERN.finditer(praw_ini_text)
+    )
+
+
+def _check_praw_ini_local_is_dummy() -> bool:
+    """Check whether the local praw.ini already has the dummy config."""
+    try:
+        praw_ini_text = PRAW_INI_PATH_LOCAL.read_text(encoding="utf-8")
+    except (OSError, UnicodeError):
+        return False
+    return praw_ini_text == DUMMY_PRAW_INI_TEXT
 
 
 def _check_env_var_set(env_var: str) -> bool:
     """Check if the environment variable is set to a non-whitespace value."""
-    env_var_value = os.getenv(env_var)
+    env_var_value = os.environ.get(env_var)
     return bool(env_var_value and env_var_value.strip())
 
 
@@ -111,24 +142,25 @@ def _get_val_id_from_collection(
     """Extract a suitible test ID string from a collection, if possible."""
     if isinstance(val, Mapping):
         # static analysis: ignore[undefined_attribute]
-        val_iter = iter(val.values())
+        val_items: list[object] = list(val.values())
     else:
-        val_iter = iter(val)
-    if len(val) == 1:
-        val_id: object = next(val_iter)
-        return val_id
-    if all(isinstance(val_item, str) for val_item in val):
+        val_items = list(val)
+    if len(val_items) == 1:
+        return val_items[0]
+    if val_items and all(isinstance(val_item, str) for val_item in val_items):
         # static analysis: ignore[incompatible_argument]
-        return " ".join(val)  # type: ignore[arg-type]
+        return " ".join(val_items)  # type: ignore[arg-type]
 
     return val
 
 
 def _get_val_id(val: object) -> str | object:  # noqa: WPS110
     """Get the ID string from an arbitrary test param object, if possible."""
-    val_name: object = getattr(val, "name", None)
     if isinstance(val, Path):
         return val.stem
+    if isinstance(val, enum.Enum):
+        return val.name
+    val_name: object = getattr(val, "name", None)
     # static analysis: ignore[non_boolean_in_boolean_context]
     if val_name and isinstance(val_name, str):
         return val_name
@@ -139,21 +171,50 @@ def _get_val_id(val: object) -> str | object:  # noqa: WPS110
     return val
 
 
+def _get_str_id(val: str) -> str:  # noqa: WPS110
+    """Normalize a string test param into an ID string."""
+    return val.replace("-", "").strip()
+
+
+def _get_path_id(val: Path) -> str:  # noqa: WPS110
+    """Get the ID string from a path test param."""
+    return _get_str_id(val.stem)
+
+
+PARAM_ID_HANDLERS: Final[dict[type, Callable[..., str]]] = {
+    str: _get_str_id,
+    bytes: bytes.decode,
+    type(Path()): _get_path_id,
+    type(None): str,
+    **{scalar_type: str for scalar_type in SCALAR_ID_TYPES},
+}
+
+
 # ---- Hooks ----
 
 
 def pytest_addoption(parser: Parser) -> None:
-    """Add an option to run online tests to the pytest argument parser."""
+    """Add options to run online and slow tests to the pytest arg parser."""
     parser.addoption(
         RUN_ONLINE_OPTION,
         action="store_true",
         default=False,
         help="Run tests that require interacting with live Reddit",
     )
+    parser.addoption(
+        RUN_SLOW_OPTION,
+        action="store_true",
+        default=False,
+        help="Run tests that take a while, e.g. spawning a new interpreter",
+    )
 
 
 def pytest_configure(config: Config) -> None:
     """Add a temporary local PRAW.ini with the test bot site if not found."""
+    # Let the xdist controller manage the shared file for all the workers
+    if hasattr(config, XDIST_WORKER_ATTR):
+        return
+
     run_online = config.getoption(RUN_ONLINE_OPTION)
     has_test_site_name = _get_praw_ini_has_site_name(TEST_SITE_NAME)
     if run_online and has_test_site_name:
@@ -162,62 +223,62 @@ def pytest_configure(config: Config) -> None:
     if run_online:
         missing_env_vars = _get_missing_praw_env_vars()
         if missing_env_vars:
-            error_highlight = "*" * (LINE_LENGTH // 2)
-            error_divider = f"{error_highlight} WARNING {error_highlight}"
             error_message = (
                 f"PRAW site {TEST_SITE_NAME!r} missing in praw.ini "
                 f"and environment variable(s) not found:\n{missing_env_vars}\n"
                 "Online tests will fail due to lacking Reddit authentication"
             )
             error_message_full = "\n".join(
-                ["", error_divider, error_message, error_divider, ""],
+                ["", WARNING_DIVIDER, error_message, WARNING_DIVIDER, ""],
             )
             print(error_message_full)  # noqa: WPS421
 
-    praw_config = configparser.ConfigParser()
-    praw_config[TEST_SITE_NAME] = DUMMY_ACCOUNT_CONFIG
-    with open(
-        PRAW_INI_PATH_LOCAL,
-        mode="w",
-        encoding="utf-8",
-    ) as praw_ini_file_offline:
-        praw_config.write(praw_ini_file_offline)
+    if not _check_praw_ini_local_is_dummy():
+        PRAW_INI_PATH_LOCAL.write_text(DUMMY_PRAW_INI_TEXT, encoding="utf-8")
 
 
-def pytest_unconfigure(
-    config: Config,  # pylint: disable = unused-argument
-) -> None:
+def pytest_unconfigure(config: Config) -> None:
     """Remove the temporary PRAW.ini in the working directory."""
-    praw_ini_path = PRAW_INI_PATH_LOCAL
-    if praw_ini_path.exists():
-        praw_ini_path.unlink()
+    if hasattr(config, XDIST_WORKER_ATTR):
+        return
+    if _check_praw_ini_local_is_dummy():
+        PRAW_INI_PATH_LOCAL.unlink()
 
 
 def pytest_collection_modifyitems(
     config: Config,
     items: list[pytest.Item],
 ) -> None:
-    """Ensure that online tests are skipped unless run online is passed."""
-    if not config.getoption(RUN_ONLINE_OPTION):
-        skip_online = pytest.mark.skip(reason="Needs --run-online")
-        for item in items:
-            if "online" in item.keywords:
-                item.add_marker(skip_online)
+    """Ensure that online/slow tests are skipped unless the opt is passed."""
+    if not items:
+        return
+    for marker_name, option_name in (
+        ("online", RUN_ONLINE_OPTION),
+        ("slow", RUN_SLOW_OPTION),
+    ):
+        if config.getoption(option_name):
+            continue
+        marked_items = [
+            item for item in items if item.get_closest_marker(marker_name)
+        ]
+        skip_marked = pytest.mark.skip(reason=f"Needs {option_name}")
+        for marked_item in marked_items:
+            marked_item.add_marker(skip_marked)
 
 
 def pytest_make_parametrize_id(val: object) -> str | None:  # noqa: WPS110
     """Intelligently generate parameter IDs; hook for pytest."""
-    val_id: object
-    if isinstance(val, (str, bytes)):
-        val_id = val
-    else:
-        val_id = _get_val_id(val)
+    # Look up the common exact types directly before the generic handling
+    id_handler = PARAM_ID_HANDLERS.get(type(val))
+    if id_handler is not None:
+        return id_handler(val)
 
+    val_id = _get_val_id(val)
     if isinstance(val_id, bytes):
         return val_id.decode()
     if isinstance(val_id, str):
-        return val_id.strip().strip("-").replace("-", "")
-    if val_id is None or isinstance(val_id, (int, float, complex, bool)):
+        return _get_str_id(val_id)
+    if val_id is None or isinstance(val_id, SCALAR_ID_TYPES):
         return str(val_id)
 
     return None
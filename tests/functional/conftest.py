@@ -6,7 +6,13 @@ from __future__ import (
 )
 
 # Standard library imports
+import contextlib
 import copy
+import functools
+import hashlib
+import io
+import json
+import runpy
 import shutil
 import subprocess  # nosec
 import sys
@@ -104,6 +110,7 @@ else:
     InvokeOutput = subprocess.CompletedProcess
 
 InvokeCommandCallable = Callable[[str], InvokeOutput]
+InvokeCommandWithCallable = Callable[[ArgList, str], InvokeOutput]
 
 
 # ---- Constants ----
@@ -115,7 +122,11 @@ DEBUG_ARGS: Final[ArgList] = ["", "--debug"]
 
 # Invocation constants
 ENTRYPOINT_NAME: Final[str] = PACKAGE_NAME
-INVOCATION_RUNPY: Final[ArgList] = [
+MAIN_MODULE_NAME: Final[str] = f"{PACKAGE_NAME}.__main__"
+INVOCATION_INPROCESS: Final[ArgList] = []
+INVOCATION_INPROCESS_RUNPY: Final[ArgList] = ["-m", PACKAGE_NAME]
+INVOCATION_RUNPY: Final[ArgList] = [sys.executable, "-m", PACKAGE_NAME]
+INVOCATION_RUNPY_DEV: Final[ArgList] = [
     sys.executable,
     "-b",
     "-X",
@@ -123,13 +134,18 @@ INVOCATION_RUNPY: Final[ArgList] = [
     "-m",
     PACKAGE_NAME,
 ]
-INVOCATION_METHODS: Final[list[ArgList]] = [
-    [ENTRYPOINT_NAME],
-    INVOCATION_RUNPY,
+INVOCATION_METHODS: Final[list[object]] = [
+    pytest.param(INVOCATION_INPROCESS, id="inprocess"),
+    pytest.param(INVOCATION_INPROCESS_RUNPY, id="inprocessrunpy"),
 ]
-INVOCATION_IDS: Final[list[str]] = [
-    "entrypoint",
-    "runpy",
+INVOCATION_METHODS_SUBPROCESS: Final[list[object]] = [
+    pytest.param([ENTRYPOINT_NAME], id="entrypoint"),
+    pytest.param(INVOCATION_RUNPY, id="runpy", marks=[pytest.mark.slow]),
+    pytest.param(
+        INVOCATION_RUNPY_DEV,
+        id="runpydev",
+        marks=[pytest.mark.slow],
+    ),
 ]
 
 # Extension constants
@@ -137,8 +153,16 @@ CONFIG_EXTENSIONS_GOOD: Final[list[str]] = ["toml", "json"]
 CONFIG_EXTENSIONS_GOOD_GENERATE: Final[list[str]] = ["toml"]
 CONFIG_EXTENSIONS_BAD: Final[list[str]] = ["xml", "ini", "txt"]
 
+# Config content constants
+EMPTY_CONFIG_BYTES: Final[bytes] = b"\n"
+LIST_CONFIG_BYTES: Final[bytes] = json.dumps(
+    ["spam", "eggs"],
+    indent=4,
+).encode("utf-8")
+
 # Path constants
 CONFIG_DATA_DIR: Final[Path] = Path(__file__).parent / "data"
+EXAMPLE_CONFIG_STEM: Final[str] = "example_config_static"
 
 RSPACEX_CONFIG_PATH: Final[Path] = CONFIG_DATA_DIR / "rspacex.toml"
 TECHNICAL_CONFIG_PATH: Final[Path] = CONFIG_DATA_DIR / "sxtechnical.toml"
@@ -170,24 +194,42 @@ def apply_marks_to_param_configs(
     return param_configs_marked
 
 
+# ---- Output capture helpers ----
+
+
+def call_capturing_output(function: Callable[[], object]) -> RunCLIOutput:
+    """Call the function, capturing its output and any ``SystemExit``."""
+    buffer_out = io.StringIO()
+    buffer_err = io.StringIO()
+    captured_error = None
+    with contextlib.redirect_stdout(buffer_out):
+        with contextlib.redirect_stderr(buffer_err):
+            try:
+                function()
+            except SystemExit as error:
+                captured_error = error
+    captured_output = CaptureResult(
+        out=buffer_out.getvalue(),
+        err=buffer_err.getvalue(),
+    )
+    return captured_output, captured_error
+
+
 # ---- Test helper fixtures ----
 
 
 @pytest.fixture(name="run_cli")
-def fixture_run_cli(capfd: pytest.CaptureFixture[str]) -> RunCLICallable:
+def fixture_run_cli() -> RunCLICallable:
     """Run the package CLI with the passed argument(s)."""
 
     def _run_cli(
         cli_args: Sequence[str],
     ) -> RunCLIOutput:
-        cli_args = [arg for arg in cli_args if arg]
-        captured_error = None
-        try:
-            submanager.cli.main(cli_args)
-        except SystemExit as error:
-            captured_error = error
-        captured_output = capfd.readouterr()
-        return captured_output, captured_error
+        if not all(cli_args):
+            cli_args = [arg for arg in cli_args if arg]
+        return call_capturing_output(
+            functools.partial(submanager.cli.main, cli_args),
+        )
 
     return _run_cli
 
@@ -299,22 +341,61 @@ def run_and_check_debug(
     return _test_debug_error
 
 
-@pytest.fixture(params=INVOCATION_METHODS, ids=INVOCATION_IDS)
+@pytest.fixture(name="invoke_command_with")
+def fixture_invoke_command_with(
+    monkeypatch: pytest.MonkeyPatch,
+    run_cli: RunCLICallable,
+) -> InvokeCommandWithCallable:
+    """Invoke the passed command with the passed invocation."""
+
+    def _invoke_command_with(
+        invocation: ArgList,
+        command: str,
+    ) -> InvokeOutput:
+        if not invocation:
+            captured_output, captured_error = run_cli([command])
+        elif invocation == INVOCATION_INPROCESS_RUNPY:
+            monkeypatch.setattr(sys, "argv", [PACKAGE_NAME, command])
+            monkeypatch.delitem(sys.modules, MAIN_MODULE_NAME, raising=False)
+            captured_output, captured_error = call_capturing_output(
+                functools.partial(
+                    runpy.run_module,
+                    PACKAGE_NAME,
+                    run_name="__main__",
+                    alter_sys=True,
+                ),
+            )
+        else:
+            process_result = subprocess.run(
+                invocation + [command],
+                capture_output=True,
+                check=False,
+                encoding="utf-8",
+                text=True,
+            )
+            return process_result
+
+        exit_code = captured_error.code if captured_error else None
+        return InvokeOutput(
+            args=[*invocation, command],
+            returncode=int(exit_code or 0),
+            stdout=captured_output.out,
+            stderr=captured_output.err,
+        )
+
+    return _invoke_command_with
+
+
+@pytest.fixture(params=INVOCATION_METHODS)
 def invoke_command(
     request: pytest.FixtureRequest,
+    invoke_command_with: InvokeCommandWithCallable,
 ) -> InvokeCommandCallable:
-    """Invoke the passed command with a given invocation."""
+    """Invoke the passed command with a given in-process invocation."""
+    invocation: ArgList = request.param  # type: ignore[attr-defined]
 
     def _invoke_command(command: str) -> InvokeOutput:
-        invocation: ArgList = request.param  # type: ignore[attr-defined]
-        process_result = subprocess.run(
-            invocation + [command],
-            capture_output=True,
-            check=False,
-            encoding="utf-8",
-            text=True,
-        )
-        return process_result
+        return invoke_command_with(invocation, command)
 
     return _invoke_command
 
@@ -322,6 +403,21 @@ def invoke_command(
 # ---- Setup fixtures ----
 
 
+@pytest.fixture(name="example_config_bytes", scope="session")
+def fixture_example_config_bytes(
+    tmp_path_factory: pytest.TempPathFactory,
+) -> dict[str, bytes]:
+    """Generate the example config once per format, keyed by suffix."""
+    template_dir = tmp_path_factory.mktemp("config_template")
+    example_config_bytes = {}
+    for config_extension in CONFIG_EXTENSIONS_GOOD_GENERATE:
+        template_name = f"{EXAMPLE_CONFIG_STEM}.{config_extension}"
+        template_path = template_dir / template_name
+        submanager.config.static.generate_static_config(template_path)
+        example_config_bytes[template_path.suffix] = template_path.read_bytes()
+    return example_config_bytes
+
+
 @pytest.fixture(name="temp_config_dir")
 def fixture_temp_config_dir(
     request: pytest.FixtureRequest,
@@ -356,13 +452,7 @@ def empty_config(
     temp_config_paths: submanager.models.config.ConfigPaths,
 ) -> submanager.models.config.ConfigPaths:
     """Generate an empty config file in a temp directory."""
-    with open(
-        temp_config_paths.static,
-        mode="w",
-        encoding="utf-8",
-        newline="\n",
-    ) as static_config_file:
-        static_config_file.write("\n")
+    temp_config_paths.static.write_bytes(EMPTY_CONFIG_BYTES)
     return temp_config_paths
 
 
@@ -370,21 +460,22 @@ def empty_config(
 def list_config(
     temp_config_paths: submanager.models.config.ConfigPaths,
 ) -> submanager.models.config.ConfigPaths:
-    """Generate a list config file in a temp directory."""
-    config_data: Any = ["spam", "eggs"]
-    submanager.config.utils.write_config(
-        config_data,
-        config_path=temp_config_paths.static,
-    )
+    """Generate a JSON list config file in a temp directory."""
+    temp_config_paths.static.parent.mkdir(parents=True, exist_ok=True)
+    temp_config_paths.static.write_bytes(LIST_CONFIG_BYTES)
     return temp_config_paths
 
 
 @pytest.fixture()
 def example_config(
     temp_config_paths: submanager.models.config.ConfigPaths,
+    example_config_bytes: dict[str, bytes],
 ) -> submanager.models.config.ConfigPaths:
     """Generate an example config file in a temp directory."""
-    submanager.config.static.generate_static_config(temp_config_paths.static)
+    temp_config_paths.static.parent.mkdir(parents=True, exist_ok=True)
+    temp_config_paths.static.write_bytes(
+        example_config_bytes[temp_config_paths.static.suffix],
+    )
     return temp_config_paths
 
 
@@ -407,9 +498,16 @@ def fixture_file_config(
     return temp_config_paths
 
 
+@pytest.fixture(name="loaded_config_cache", scope="session")
+def fixture_loaded_config_cache() -> dict[str, dict[str, Any]]:
+    """Cache parsed config data across tests, keyed by the file hash."""
+    return {}
+
+
 @pytest.fixture()
 def modified_config(
     file_config: submanager.models.config.ConfigPaths,
+    loaded_config_cache: dict[str, dict[str, Any]],
     request: pytest.FixtureRequest,
 ) -> submanager.models.config.ConfigPaths:
     """Modify an existing config file and return the path."""
@@ -428,16 +526,26 @@ def modified_config(
             f"not {type(update_dict)!r}",
         )
 
+    # Load the config, or copy it if it was already parsed
+    config_hash = hashlib.blake2b(
+        file_config.static.read_bytes(),
+        digest_size=16,
+    ).hexdigest()
+    config_data = loaded_config_cache.get(config_hash)
+    if config_data is None:
+        config_data = dict(
+            submanager.config.utils.load_config(file_config.static),
+        )
+        loaded_config_cache[config_hash] = config_data
+    config_data_modified = copy.deepcopy(config_data)
+
     # Disable all items if requested
-    config_data = submanager.config.utils.load_config(file_config.static)
     if disable_all:
-        config_data_modified = (
-            submanager.utils.dicthelpers.process_items_recursive(
-                dict(config_data),
-                fn_torun=lambda value: False,
-                keys_match={"enabled"},
-                inplace=False,
-            )
+        submanager.utils.dicthelpers.process_items_recursive(
+            config_data_modified,
+            fn_torun=lambda value: False,
+            keys_match={"enabled"},
+            inplace=True,
         )
         if isinstance(disable_all, str):
             config_data_level = config_data_modified
@@ -445,14 +553,12 @@ def modified_config(
                 config_data_level = config_data_level[key]
                 if config_data_level.get("enabled", None) is not None:
                     config_data_level["enabled"] = True
-    else:
-        config_data_modified = copy.deepcopy(dict(config_data))
 
     # Modify config and write it back
-    config_data_modified = submanager.utils.dicthelpers.update_recursive(
+    submanager.utils.dicthelpers.update_recursive(
         base=config_data_modified,
         update=dict(update_dict),
-        inplace=False,
+        inplace=True,
     )
     submanager.config.utils.write_config(
         config_data_modified,
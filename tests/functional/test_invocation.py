@@ -14,7 +14,11 @@ from typing_extensions import (
 # Local imports
 import submanager.enums
 from tests.functional.conftest import (
+    INVOCATION_INPROCESS,
+    INVOCATION_METHODS_SUBPROCESS,
+    ArgList,
     InvokeCommandCallable,
+    InvokeCommandWithCallable,
 )
 
 # ---- Constants ----
@@ -26,12 +30,12 @@ PARAMS_GOOD: Final[list[str]] = [
 PARAMS_BAD: Final[list[str]] = [
     "--non-existent-flag",
 ]
+PARAM_SMOKE: Final[str] = "--version"
 
 
 # ---- Tests ----
 
 
-@pytest.mark.slow()
 @pytest.mark.parametrize("command", PARAMS_GOOD)
 def test_invocation_good(
     invoke_command: InvokeCommandCallable,
@@ -46,7 +50,6 @@ def test_invocation_good(
     assert not process_result.stderr.strip()
 
 
-@pytest.mark.slow()
 @pytest.mark.parametrize("command", PARAMS_BAD)
 def test_invocation_bad(
     invoke_command: InvokeCommandCallable,
@@ -62,3 +65,19 @@ def test_invocation_bad(
     )
     assert process_result.stderr.strip()
     assert not process_result.stdout.strip()
+
+
+@pytest.mark.parametrize("invocation", INVOCATION_METHODS_SUBPROCESS)
+def test_invocation_subprocess(
+    invoke_command_with: InvokeCommandWithCallable,
+    invocation: ArgList,
+) -> None:
+    """Test that the real entrypoints run the same CLI as in-process."""
+    process_result = invoke_command_with(invocation, PARAM_SMOKE)
+    inprocess_result = invoke_command_with(INVOCATION_INPROCESS, PARAM_SMOKE)
+
+    assert process_result.returncode == inprocess_result.returncode
+    assert process_result.returncode == submanager.enums.ExitCode.SUCCESS.value
+    assert process_result.stdout.strip()
+    assert process_result.stdout == inprocess_result.stdout
+    assert not process_result.stderr.strip()
@@ -57,13 +57,12 @@ def fixture_check_service() -> CheckServiceCallable:
         if output_path.suffix.lower() != ".service":
             output_path /= OUTPUT_FILENAME_DEFAULT
 
-        assert output_path.exists()
+        with open(output_path, encoding="utf-8", newline="\n") as service_file:
+            service_text = service_file.read()
         service_config = configparser.ConfigParser()
-        assert service_config.read([output_path], encoding="utf-8")
+        service_config.read_string(service_text, source=output_path.as_posix())
         assert service_config.items()
         assert next(iter(service_config.items()))
-        with open(output_path, encoding="utf-8", newline="\n") as service_file:
-            service_text = service_file.read()
         assert service_text.strip()
         assert "\r" not in service_text
         assert "{" not in service_text
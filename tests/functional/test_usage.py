@@ -5,6 +5,14 @@ from __future__ import (
     annotations,
 )
 
+# Standard library imports
+from typing import (
+    Optional,
+    Tuple,
+    Type,
+    Union,
+)
+
 # Third party imports
 import pytest
 from typing_extensions import (
@@ -19,14 +27,61 @@ from tests.functional.conftest import (
     RunAndCheckCLICallable,
 )
 
+# ---- Types ----
+
+UsageCheckTuple = Tuple[
+    str,
+    Optional[bool],
+    Optional[submanager.enums.ExitCode],
+    Union[Type[BaseException], Literal[False]],
+]
+
+
 # ---- Constants ----
 
 HELP_COMMANDS: Final[list[str]] = ["-h", "--help"]
 GOOD_COMMANDS: Final[list[str]] = ["--version"]
 BAD_COMMANDS: Final[list[str]] = ["", " ", "--non-existent-cli-flag"]
 
-CUSTOM_CONFIG_PATHS: Final[list[Literal[False] | None]] = [False, None]
-CUSTOM_CONFIG_PATH_IDS: Final[list[str]] = ["default_paths", "custom_paths"]
+USAGE_CHECKS: Final[dict[str, UsageCheckTuple]] = {
+    **{
+        command: ("help", True, submanager.enums.ExitCode.SUCCESS, False)
+        for command in HELP_COMMANDS
+    },
+    **{
+        command: (command.replace("-", "").strip(), None, None, False)
+        for command in GOOD_COMMANDS
+    },
+    **{
+        command: (
+            "usage",
+            None,
+            submanager.enums.ExitCode.ERROR_PARAMETERS,
+            False if command else AttributeError,
+        )
+        for command in BAD_COMMANDS
+    },
+}
+
+# Blank commands would otherwise get empty, indistinguishable test IDs
+COMMAND_IDS: Final[dict[str, str]] = {
+    **{command: command.replace("-", "") for command in USAGE_CHECKS},
+    "": "empty",
+    " ": "space",
+}
+
+# Help and version exit before the config paths are used, so only check
+# that passing custom paths doesn't change how bad commands are handled
+COMMAND_CONFIG_PATH_PARAMS: Final = [
+    *[
+        pytest.param(command, False, id=f"{COMMAND_IDS[command]}-default")
+        for command in USAGE_CHECKS
+    ],
+    *[
+        pytest.param(command, None, id=f"{COMMAND_IDS[command]}-custom")
+        for command in BAD_COMMANDS
+    ],
+]
 
 
 # ---- Tests ----
@@ -34,13 +89,8 @@ CUSTOM_CONFIG_PATH_IDS: Final[list[str]] = ["default_paths", "custom_paths"]
 
 @pytest.mark.parametrize("debug", DEBUG_ARGS)
 @pytest.mark.parametrize(
-    "custom_config_paths",
-    CUSTOM_CONFIG_PATHS,
-    ids=CUSTOM_CONFIG_PATH_IDS,
-)
-@pytest.mark.parametrize(
-    "command",
-    HELP_COMMANDS + GOOD_COMMANDS + BAD_COMMANDS,
+    ("command", "custom_config_paths"),
+    COMMAND_CONFIG_PATH_PARAMS,
 )
 def test_command_usage(
     run_and_check_cli: RunAndCheckCLICallable,
@@ -49,21 +99,7 @@ def test_command_usage(
     debug: str,
 ) -> None:
     """Test that the program handles good, bad and help commands properly."""
-    check_exits = None
-    check_code = None
-    check_error: type[BaseException] | Literal[False] = False
-    if command in HELP_COMMANDS:
-        check_text = "help"
-        check_exits = True
-        check_code = submanager.enums.ExitCode.SUCCESS
-    elif command in BAD_COMMANDS:
-        check_text = "usage"
-        check_code = submanager.enums.ExitCode.ERROR_PARAMETERS
-        check_error = False if command else AttributeError
-    elif command in GOOD_COMMANDS:
-        check_text = command.replace("-", "").strip()
-    else:
-        raise ValueError(f"Command {command!r} not found in good, bad or help")
+    check_text, check_exits, check_code, check_error = USAGE_CHECKS[command]
 
     run_and_check_cli(
         cli_args=[debug, command],
@@ -47,6 +47,17 @@ ExpectedTuple = Tuple[
 ParamConfigs = Dict[str, Tuple[RequestTuple, ExpectedTuple]]
 
 
+# ---- Helpers ----
+
+
+def build_nested_dict(key_path: str, value: ConfigDict) -> ConfigDict:
+    """Nest the passed value under the dict keys of a dotted key path."""
+    nested_dict = value
+    for key in reversed(key_path.split(".")):
+        nested_dict = {key: nested_dict}
+    return nested_dict
+
+
 # ---- Constants ----
 
 # pylint: disable = consider-using-namedtuple-or-dataclass
@@ -82,6 +93,19 @@ READONLY_EXPECTED: Final[ExpectedTuple] = (
     submanager.exceptions.RedditReadOnlyError,
 )
 
+# Empty JSON isn't valid JSON, so it fails to parse rather than being empty
+EMPTY_CONFIG_EXPECTED: Final[dict[str, ExpectedTuple]] = {
+    **{
+        extension: ("extension", submanager.exceptions.ConfigExtensionError)
+        for extension in CONFIG_EXTENSIONS_BAD
+    },
+    **{
+        extension: ("empty", submanager.exceptions.ConfigEmptyError)
+        for extension in CONFIG_EXTENSIONS_GOOD
+    },
+    "json": ("pars", submanager.exceptions.ConfigParsingError),
+}
+
 BAD_VALIDATE_OFFLINE_PARAMS: Final[ParamConfigs] = {
     "non_existent_key": (
         {PSEUDORANDOM_STRING: PSEUDORANDOM_STRING},
@@ -159,202 +183,113 @@ BAD_VALIDATE_ONLINE_PARAMS: Final[ParamConfigs] = {
     ),
     "thread_source_notfound": (
         (
-            {
-                "thread_manager": {
-                    "items": {
-                        "cycle_thread": {
-                            "source": {"endpoint_name": PSEUDORANDOM_STRING},
-                        },
-                    },
-                },
-            },
+            build_nested_dict(
+                "thread_manager.items.cycle_thread.source",
+                {"endpoint_name": PSEUDORANDOM_STRING},
+            ),
             "thread_manager.items.cycle_thread",
         ),
         ("found", submanager.exceptions.RedditObjectNotFoundError),
     ),
     "menu_notfound": (
         (
-            {
-                "sync_manager": {
-                    "items": {
-                        "menus": {
-                            "targets": {
-                                "new_reddit_menu": {
-                                    "context": {
-                                        "subreddit": NON_MOD_SUBREDDIT,
-                                    },
-                                },
-                            },
-                        },
-                    },
-                },
-            },
+            build_nested_dict(
+                "sync_manager.items.menus.targets.new_reddit_menu",
+                {"context": {"subreddit": NON_MOD_SUBREDDIT}},
+            ),
             "sync_manager.items.menus.targets.new_reddit_menu",
         ),
         ("create", submanager.exceptions.RedditObjectNotFoundError),
     ),
     "thread_notfound": (
         (
-            {
-                "sync_manager": {
-                    "items": {
-                        "sidebar_thread": {
-                            "targets": {
-                                "thread_target": {
-                                    "endpoint_name": PSEUDORANDOM_STRING,
-                                },
-                            },
-                        },
-                    },
-                },
-            },
+            build_nested_dict(
+                "sync_manager.items.sidebar_thread.targets.thread_target",
+                {"endpoint_name": PSEUDORANDOM_STRING},
+            ),
             "sync_manager.items.sidebar_thread.targets.thread_target",
         ),
         ("found", submanager.exceptions.RedditObjectNotFoundError),
     ),
     "thread_notop": (
         (
-            {
-                "sync_manager": {
-                    "items": {
-                        "sidebar_thread": {
-                            "targets": {
-                                "thread_target": {
-                                    "endpoint_name": THREAD_ID_NOT_OP,
-                                },
-                            },
-                        },
-                    },
-                },
-            },
+            build_nested_dict(
+                "sync_manager.items.sidebar_thread.targets.thread_target",
+                {"endpoint_name": THREAD_ID_NOT_OP},
+            ),
             "sync_manager.items.sidebar_thread.targets.thread_target",
         ),
         ("account", submanager.exceptions.NotOPError),
     ),
     "thread_wrong_type": (
         (
-            {
-                "sync_manager": {
-                    "items": {
-                        "sidebar_thread": {
-                            "targets": {
-                                "thread_target": {
-                                    "endpoint_name": THREAD_ID_LINK,
-                                },
-                            },
-                        },
-                    },
-                },
-            },
+            build_nested_dict(
+                "sync_manager.items.sidebar_thread.targets.thread_target",
+                {"endpoint_name": THREAD_ID_LINK},
+            ),
             "sync_manager.items.sidebar_thread.targets.thread_target",
         ),
         ("link", submanager.exceptions.PostTypeError),
     ),
     "widget_notfound": (
         (
-            {
-                "sync_manager": {
-                    "items": {
-                        "sidebar_thread": {
-                            "targets": {
-                                "new_reddit_widget": {
-                                    "endpoint_name": PSEUDORANDOM_STRING,
-                                },
-                            },
-                        },
-                    },
-                },
-            },
+            build_nested_dict(
+                "sync_manager.items.sidebar_thread.targets.new_reddit_widget",
+                {"endpoint_name": PSEUDORANDOM_STRING},
+            ),
             "sync_manager.items.sidebar_thread.targets.new_reddit_widget",
         ),
         ("found", submanager.exceptions.RedditObjectNotFoundError),
     ),
     "widget_wrong_type": (
         (
-            {
-                "sync_manager": {
-                    "items": {
-                        "sidebar_thread": {
-                            "targets": {
-                                "new_reddit_widget": {
-                                    "endpoint_name": NON_SUPPORTED_WIDGET,
-                                },
-                            },
-                        },
-                    },
-                },
-            },
+            build_nested_dict(
+                "sync_manager.items.sidebar_thread.targets.new_reddit_widget",
+                {"endpoint_name": NON_SUPPORTED_WIDGET},
+            ),
             "sync_manager.items.sidebar_thread.targets.new_reddit_widget",
         ),
         ("type", submanager.exceptions.WidgetTypeError),
     ),
     "widget_notwriteable": (
         (
-            {
-                "sync_manager": {
-                    "items": {
-                        "sidebar_thread": {
-                            "targets": {
-                                "new_reddit_widget": {
-                                    "endpoint_name": NON_WRITEABLE_WIDGET,
-                                    "context": {
-                                        "subreddit": NON_MOD_SUBREDDIT,
-                                    },
-                                },
-                            },
-                        },
-                    },
+            build_nested_dict(
+                "sync_manager.items.sidebar_thread.targets.new_reddit_widget",
+                {
+                    "endpoint_name": NON_WRITEABLE_WIDGET,
+                    "context": {"subreddit": NON_MOD_SUBREDDIT},
                 },
-            },
+            ),
             "sync_manager.items.sidebar_thread.targets.new_reddit_widget",
         ),
         ("mod", submanager.exceptions.NotAModError),
     ),
     "wiki_notfound_source": (
         (
-            {
-                "sync_manager": {
-                    "items": {
-                        "cross_sub_sync": {
-                            "source": {"endpoint_name": PSEUDORANDOM_STRING},
-                        },
-                    },
-                },
-            },
+            build_nested_dict(
+                "sync_manager.items.cross_sub_sync.source",
+                {"endpoint_name": PSEUDORANDOM_STRING},
+            ),
             "sync_manager.items.cross_sub_sync.targets.index_clone",
         ),
         ("found", submanager.exceptions.RedditObjectNotFoundError),
     ),
     "wiki_notaccessible_source": (
         (
-            {
-                "sync_manager": {
-                    "items": {
-                        "cross_sub_sync": {
-                            "source": {"endpoint_name": NON_ACCESSIBLE_PAGE},
-                        },
-                    },
-                },
-            },
+            build_nested_dict(
+                "sync_manager.items.cross_sub_sync.source",
+                {"endpoint_name": NON_ACCESSIBLE_PAGE},
+            ),
             "sync_manager.items.cross_sub_sync.targets.index_clone",
         ),
         ("access", submanager.exceptions.RedditObjectNotAccessibleError),
     ),
     "wiki_notfound_target": (
         (
-            {
-                "sync_manager": {
-                    "items": {
-                        "disabled_sync_item": {
-                            "targets": {
-                                "non_existent": {
-                                    "endpoint_name": PSEUDORANDOM_STRING,
-                                },
-                            },
-                        },
-                    },
-                },
-            },
+            build_nested_dict(
+                "sync_manager.items.disabled_sync_item.targets.non_existent",
+                {"endpoint_name": PSEUDORANDOM_STRING},
+            ),
             "sync_manager.items.disabled_sync_item.targets.non_existent",
         ),
         ("found", submanager.exceptions.RedditObjectNotFoundError),
@@ -368,28 +303,33 @@ BAD_VALIDATE_ONLINE_PARAMS: Final[ParamConfigs] = {
     ),
     "wiki_notwriteable_target": (
         (
-            {
-                "sync_manager": {
-                    "items": {
-                        "disabled_sync_item": {
-                            "targets": {
-                                "non_existent": {
-                                    "endpoint_name": NON_WRITEABLE_PAGE,
-                                    "context": {
-                                        "subreddit": NON_MOD_SUBREDDIT,
-                                    },
-                                },
-                            },
-                        },
-                    },
+            build_nested_dict(
+                "sync_manager.items.disabled_sync_item.targets.non_existent",
+                {
+                    "endpoint_name": NON_WRITEABLE_PAGE,
+                    "context": {"subreddit": NON_MOD_SUBREDDIT},
                 },
-            },
+            ),
             "sync_manager.items.disabled_sync_item.targets.non_existent",
         ),
         ("edit", submanager.exceptions.WikiPagePermissionError),
     ),
 }
 
+# Online endpoint repeating an earlier one, so its result should be reused
+DUPLICATE_ENDPOINT_UID: Final[str] = (
+    "sync_manager.items.menus.targets.old_reddit_menu_copy"
+)
+DUPLICATE_ENDPOINT_CONFIG: Final[ConfigDict] = build_nested_dict(
+    DUPLICATE_ENDPOINT_UID,
+    {
+        "description": "Old Reddit Menu Copy",
+        "enabled": True,
+        "endpoint_name": "config/sidebar",
+        "endpoint_type": "WIKI_PAGE",
+    },
+)
+
 
 # ---- Tests ----
 
@@ -453,16 +393,7 @@ def test_config_empty_error(
 ) -> None:
     """Test that validating a config file with an unknown extension errors."""
     extension = empty_config.static.suffix.lstrip(".")
-    check_error: type[submanager.exceptions.SubManagerUserError]
-    if extension == "json":
-        check_text = "pars"
-        check_error = submanager.exceptions.ConfigParsingError
-    elif extension in CONFIG_EXTENSIONS_GOOD:
-        check_text = "empty"
-        check_error = submanager.exceptions.ConfigEmptyError
-    else:
-        check_text = "extension"
-        check_error = submanager.exceptions.ConfigExtensionError
+    check_text, check_error = EMPTY_CONFIG_EXPECTED[extension]
     run_and_check_cli(
         cli_args=[VALIDATE_COMMAND, OFFLINE_ONLY_ARG, minimal],
         config_paths=empty_config,
@@ -474,6 +405,7 @@ def test_config_empty_error(
 
 @pytest.mark.parametrize("minimal", MINIMAL_ARGS)
 @pytest.mark.parametrize("temp_config_paths", ["json"], indirect=True)
+@pytest.mark.parametrize("temp_config_dir", ["", "missing_dir"], indirect=True)
 def test_config_list_error(
     run_and_check_cli: RunAndCheckCLICallable,
     list_config: submanager.models.config.ConfigPaths,
@@ -519,16 +451,8 @@ def test_parsing_error(
     minimal: str,
 ) -> None:
     """Test that config files with an invalid file format validate false."""
-    with open(file_config.static, encoding="utf-8") as config_file_read:
-        config_file_text = config_file_read.read()
-    config_file_text = config_file_text.replace('"', "", 1)
-    with open(
-        file_config.static,
-        mode="w",
-        encoding="utf-8",
-        newline="\n",
-    ) as config_file_write:
-        config_file_write.write(config_file_text)
+    config_file_bytes = file_config.static.read_bytes()
+    file_config.static.write_bytes(config_file_bytes.replace(b'"', b"", 1))
 
     run_and_check_cli(
         cli_args=[VALIDATE_COMMAND, OFFLINE_ONLY_ARG, minimal],
@@ -634,3 +558,25 @@ def test_online_error(
             check_code=submanager.enums.ExitCode.ERROR_USER,
             check_error=check_error,
         )
+
+
+@pytest.mark.online
+@pytest.mark.parametrize(
+    "modified_config",
+    [DUPLICATE_ENDPOINT_CONFIG],
+    ids=["duplicate_endpoint"],
+    indirect=True,
+)
+@pytest.mark.parametrize("file_config", CONFIG_PATHS_ONLINE, indirect=True)
+def test_duplicate_endpoint(
+    run_and_check_cli: RunAndCheckCLICallable,
+    modified_config: submanager.models.config.ConfigPaths,
+) -> None:
+    """Test that endpoints pointing to the same object are validated once."""
+    captured_output, __ = run_and_check_cli(
+        cli_args=[VALIDATE_COMMAND],
+        config_paths=modified_config,
+        check_text="succe",
+    )
+    check_text = f"validating endpoint {DUPLICATE_ENDPOINT_UID!r} (cached)"
+    assert check_text in captured_output.out.lower()
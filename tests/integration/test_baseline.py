@@ -24,12 +24,14 @@ def import_submodules_recursive(
     if not package.__spec__:
         raise ImportError("Package must have a valid spec")
     search_path = package.__spec__.submodule_search_locations
-    found_submodules = {}
-    for module_info in pkgutil.walk_packages(search_path):
-        full_name = f"{package.__name__}.{module_info.name}"
-        found_submodules[full_name] = importlib.import_module(full_name)
-        if module_info.ispkg:
-            found_submodules.update(import_submodules_recursive(full_name))
+    # With the package prefix, walk_packages descends into subpackages itself
+    found_submodules = {
+        module_info.name: importlib.import_module(module_info.name)
+        for module_info in pkgutil.walk_packages(
+            search_path,
+            prefix=f"{package.__name__}.",
+        )
+    }
     return found_submodules
 
 
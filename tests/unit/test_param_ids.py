@@ -0,0 +1,37 @@
+"""Test that the custom test parameter IDs are generated properly."""
+
+# Future imports
+from __future__ import (
+    annotations,
+)
+
+# Standard library imports
+import enum
+import types
+
+# Third party imports
+import pytest
+
+# Local imports
+import submanager.enums
+from tests.conftest import (
+    pytest_make_parametrize_id,
+)
+
+# ---- Tests ----
+
+
+@pytest.mark.parametrize(
+    "enum_member",
+    [submanager.enums.ExitCode.SUCCESS, submanager.enums.EndpointType.MENU],
+    ids=str,
+)
+def test_enum_param_id(enum_member: enum.Enum) -> None:
+    """Test that enum members get their name as their parameter ID."""
+    assert pytest_make_parametrize_id(enum_member) == enum_member.name
+
+
+def test_named_object_param_id() -> None:
+    """Test that objects with a name set on the instance use it as the ID."""
+    named_object = types.SimpleNamespace(name="named_object")
+    assert pytest_make_parametrize_id(named_object) == "named_object"
@@ -0,0 +1,43 @@
+"""Test the account validation helpers without connecting to Reddit."""
+
+# Future imports
+from __future__ import (
+    annotations,
+)
+
+# Standard library imports
+from unittest import (
+    mock,
+)
+
+# Third party imports
+import pytest
+
+# Local imports
+import submanager.exceptions
+import submanager.validation.accounts
+
+# ---- Tests ----
+
+
+def test_read_post_empty_listing_warns() -> None:
+    """Test that an empty post listing warns rather than erroring."""
+    reddit = mock.MagicMock()
+    reddit.subreddit.return_value.hot.return_value = iter([])
+
+    with pytest.warns(
+        submanager.exceptions.TestPageNotFoundWarning,
+        match=(
+            "^No posts found in sub "
+            f"'r/{submanager.validation.accounts.TEST_SUB_POST}'"
+        ),
+    ):
+        submanager.validation.accounts.try_perform_test_request(
+            reddit=reddit,
+            account_key="testbot",
+            scope_check=submanager.validation.accounts.ScopeCheck.READ_POST,
+        )
+
+    reddit.subreddit.assert_called_once_with(
+        submanager.validation.accounts.TEST_SUB_POST,
+    )
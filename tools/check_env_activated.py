@@ -7,12 +7,16 @@ from __future__ import (
 )
 
 # Standard library imports
+import importlib.util
 import sys
 from typing import (
     NoReturn,
+    Sequence,
 )
 
 EXIT_BADENV = 3
+RUNTIME_MODULES = ("praw", "pydantic")
+LINTING_MODULES = ("mypy", "pyanalyze", "pylint")
 
 
 def handle_error(error: BaseException, message: str = "") -> NoReturn:
@@ -32,25 +36,25 @@ def handle_error(error: BaseException, message: str = "") -> NoReturn:
     sys.exit(EXIT_BADENV)
 
 
+def check_modules_found(module_names: Sequence[str], message: str) -> None:
+    """Check the modules can be found, without the cost of importing them."""
+    missing_modules = [
+        module_name
+        for module_name in module_names
+        if importlib.util.find_spec(module_name) is None
+    ]
+    if missing_modules:
+        error = ModuleNotFoundError(
+            f"No module(s) named {missing_modules!r}",
+            name=missing_modules[0],
+        )
+        handle_error(error=error, message=message)
+
+
 def main() -> None:
-    """Try importing key deps and fail with a friendly error message."""
-    # pylint: disable = import-outside-toplevel
-    # pylint: disable = too-many-try-statements
-    # pylint: disable = unused-import
-    try:
-        # Third party imports
-        import praw  # noqa: F401
-        import pydantic  # noqa: F401
-    except ImportError as error:
-        handle_error(error=error, message="Runtime dependencies not found")
-
-    try:
-        # Third party imports
-        import mypy  # noqa: F401
-        import pyanalyze  # type: ignore[import]  # noqa: F401
-        import pylint  # type: ignore[import]  # noqa: F401
-    except ImportError as error:
-        handle_error(error=error, message="Linting dependencies not found")
+    """Check for key deps and fail with a friendly error message."""
+    check_modules_found(RUNTIME_MODULES, "Runtime dependencies not found")
+    check_modules_found(LINTING_MODULES, "Linting dependencies not found")
 
 
 if __name__ == "__main__":
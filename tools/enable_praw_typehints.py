@@ -22,11 +22,12 @@ PY_TYPED_FILENAME = "py.typed"
 def ensure_py_typed_exists() -> bool:
     """Ensure the py.typed file exists for praw, creating it if necessary."""
     py_typed_path = Path(praw.__file__).parent / PY_TYPED_FILENAME
-    if py_typed_path.exists():
+    try:
+        py_typed_path.touch(exist_ok=False)
+    except FileExistsError:
         return True
 
-    print(f"Creating PRAW py.typed at {py_typed_path.as_posix()!r}")
-    py_typed_path.touch()
+    print(f"Created PRAW py.typed at {py_typed_path.as_posix()!r}")
     return False
 
 
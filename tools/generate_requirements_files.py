@@ -16,6 +16,7 @@ from pathlib import (
 )
 from typing import (
     Collection,
+    Mapping,
     Sequence,
 )
 
@@ -56,6 +57,63 @@ REQUIREMENT_CONFIGS_ALL: Final[dict[str, tuple[list[str], bool]]] = {
 # ---- Main logic ----
 
 
+def compile_requirements_file(
+    req_name: str,
+    extras: Sequence[str],
+    *,
+    allow_unsafe: bool,
+    env_vars: Mapping[str, str],
+    verbose: bool = False,
+) -> None:
+    """Generate a single pinned requirements file with pip-compile."""
+    # Setup args
+    if req_name == "DEFAULT":
+        output_filename = OUTPUT_FILENAME.format(suffix="")
+    else:
+        output_filename = OUTPUT_FILENAME.format(suffix=f"-{req_name}")
+    if verbose:
+        print(f"Generating requirements for {output_filename!r}")
+
+    # Run pip-compile
+    extra_args = []
+    for extra in extras:
+        if extra.endswith(".in"):
+            extra_args += [extra]
+        else:
+            extra_args += ["--extra", extra]
+    pip_compile_invocation = [
+        *BASE_PIP_COMPILE_INVOCATION,
+        "--allow-unsafe" if allow_unsafe else "--no-allow-unsafe",
+        "--output-file",
+        output_filename,
+        *extra_args,
+    ]
+    pip_compile_result = subprocess.run(  # nosemgrep
+        pip_compile_invocation,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        check=False,
+        text=True,
+        env=env_vars,
+        cwd=PROJECT_DIR,
+    )
+    try:
+        pip_compile_result.check_returncode()
+    except subprocess.CalledProcessError:
+        print(
+            f"ERROR when running pip-compile for {output_filename!r}:\n",
+            file=sys.stderr,
+        )
+        print(pip_compile_result.stderr, file=sys.stderr)
+        raise
+
+    # Set correct line endings, only rewriting the file if they differ
+    output_path = PROJECT_DIR / output_filename
+    requirement_contents = output_path.read_bytes()
+    if b"\r\n" in requirement_contents:
+        output_path.write_bytes(requirement_contents.replace(b"\r\n", b"\n"))
+
+
 def generate_requirements_files(
     req_keys: Collection[str] | None,
     verbose: bool = False,
@@ -76,51 +134,16 @@ def generate_requirements_files(
 
     script_invocation_str = " ".join(SCRIPT_INVOCATION)
     env_vars = {**os.environ, "CUSTOM_COMPILE_COMMAND": script_invocation_str}
+
+    # Run serially, as the runs share the in-tree build and pip-tools cache
     for req_name, (extras, allow_unsafe) in requirement_configs.items():
-        # Setup args
-        if req_name == "DEFAULT":
-            output_filename = OUTPUT_FILENAME.format(suffix="")
-        else:
-            output_filename = OUTPUT_FILENAME.format(suffix=f"-{req_name}")
-        if verbose:
-            print(f"Generating requirements for {output_filename!r}")
-
-        # Run pip-compile
-        extra_args = []
-        for extra in extras:
-            if extra.endswith(".in"):
-                extra_args += [extra]
-            else:
-                extra_args += ["--extra", extra]
-        pip_compile_invocation = [
-            *BASE_PIP_COMPILE_INVOCATION,
-            "--allow-unsafe" if allow_unsafe else "--no-allow-unsafe",
-            "--output-file",
-            output_filename,
-            *extra_args,
-        ]
-        pip_compile_result = subprocess.run(  # nosemgrep
-            pip_compile_invocation,
-            stdout=subprocess.DEVNULL,
-            stderr=subprocess.PIPE,
-            check=False,
-            text=True,
-            env=env_vars,
-            cwd=PROJECT_DIR,
+        compile_requirements_file(
+            req_name,
+            extras,
+            allow_unsafe=allow_unsafe,
+            env_vars=env_vars,
+            verbose=verbose,
         )
-        try:
-            pip_compile_result.check_returncode()
-        except subprocess.CalledProcessError:
-            print("ERROR when running pip-compile:\n", file=sys.stderr)
-            print(pip_compile_result.stderr, file=sys.stderr)
-            raise
-
-        # Set correct encoding and line endings
-        output_path = PROJECT_DIR / output_filename
-        with open(output_path, encoding="utf-8") as req_in:
-            requirement_contents = req_in.read()
-        with open(output_path, "w", encoding="utf-8", newline="\n") as req_out:
-            req_out.write(requirement_contents)
 
 
 def main(sys_argv: Sequence[str] | None = None) -> None: